@@ -5,6 +5,15 @@ from octopoes.models import OOI, Reference
 from octopoes.models.ooi.findings import KATFindingType, Finding
 from octopoes.models.types import HTTPHeader
 
+# checks for a wildcard in domains in the header
+# 1: one or more non-whitespace
+# 2: wildcard
+# 3: second-level domain
+# 4: end with either a space, a ';', a :port or the end of the string
+#                                      {1}{ 2}{  3  }{         4       }
+WILDCARD_DOMAIN_PATTERN = re.compile(r"\S+\*\.\S{2,3}([\s]+|$|;|:[0-9]+)")
+DOMAIN_PATTERN = re.compile(r"\S+\.\S{2,3}([\s]+|$|;|:[0-9]+)")
+
 
 def run(
     input_ooi: HTTPHeader,
@@ -23,13 +32,7 @@ def run(
     if "127.0.0.1" in header.value:
         findings.append("127.0.0.1 should not be used in the CSP settings of an HTTP Header.")
 
-    # checks for a wildcard in domains in the header
-    # 1: one or more non-whitespace
-    # 2: wildcard
-    # 3: second-level domain
-    # 4: end with either a space, a ';', a :port or the end of the string
-    #              {1}{ 2}{  3  }{         4       }
-    if re.search(r"\S+\*\.\S{2,3}([\s]+|$|;|:[0-9]+)", header.value):
+    if WILDCARD_DOMAIN_PATTERN.search(header.value):
         findings.append("The wildcard * for the scheme and host part of any URL should never be used in CSP settings.")
 
     if "unsafe-inline" in header.value or "unsafe-eval" in header.value or "unsafe-hashes" in header.value:
@@ -90,7 +93,7 @@ def _create_kat_finding(header: Reference, kat_id: str, description: str) -> Ite
 def _source_valid(policy: [str]) -> bool:
     for value in policy:
         if not (
-            re.search(r"\S+\.\S{2,3}([\s]+|$|;|:[0-9]+)", value)
+            DOMAIN_PATTERN.search(value)
             or value
             in [
                 "'none'",
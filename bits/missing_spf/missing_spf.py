@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Iterator, List
 
 from octopoes.models import OOI
@@ -9,19 +10,32 @@ import tldextract
 from octopoes.models.ooi.findings import KATFindingType, Finding
 
 
+# Use the public suffix list snapshot bundled with tldextract, so no process fetches it over HTTP or from disk cache
+tld_extractor = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=(), fallback_to_snapshot=True)
+
+
+@lru_cache(maxsize=4096)
+def extract_domain(name: str) -> tldextract.tldextract.ExtractResult:
+    return tld_extractor(name)
+
+
 def run(
     input_ooi: Hostname,
     additional_oois: List[DNSSPFRecord],
 ) -> Iterator[OOI]:
 
+    # only report on findings on the fqdn because of double findings
+    if input_ooi.name != input_ooi.fqdn.tokenized.name:
+        return
+
+    extracted = extract_domain(input_ooi.name)
+
     # Only needs SPF when it is the fqdn and not a subdomain
     if (
-        # only report on findings on the fqdn because of double findings
-        input_ooi.name == input_ooi.fqdn.tokenized.name
         # don't report on findings on subdomains because it's not needed on subdomains
-        and not tldextract.extract(input_ooi.name).subdomain
+        not extracted.subdomain
         # don't report on findings on tlds
-        and tldextract.extract(input_ooi.name).domain
+        and extracted.domain
     ):
         if not additional_oois:
             ft = KATFindingType(id="KAT-NO-SPF")
@@ -8,6 +8,8 @@ from octopoes.models.ooi.dns.zone import Hostname
 from octopoes.models.ooi.web import HTTPHeaderHostname
 from octopoes.models.types import HTTPHeader, URL, Network, HTTPHeaderURL
 
+URL_OR_HOSTNAME_PATTERN = re.compile(r"(?:(?:https?|ftp):\/\/)?[\w/\-?=%.]+\.[\w/\-&?=%.]+")
+
 
 def run(
     input_ooi: HTTPHeader,
@@ -19,7 +21,7 @@ def run(
 
     network = Network(name="internet")
 
-    urls_and_hostname = re.findall(r"(?:(?:https?|ftp):\/\/)?[\w/\-?=%.]+\.[\w/\-&?=%.]+", input_ooi.value)
+    urls_and_hostname = URL_OR_HOSTNAME_PATTERN.findall(input_ooi.value)
 
     for object in urls_and_hostname:
         try:
@@ -1,6 +1,7 @@
 # Copyright: 2022, ECP, NLnet Labs and the Internet.nl contributors
 # SPDX-License-Identifier: Apache-2.0
 import ipaddress
+from logging import getLogger
 
 from pyparsing import (
     CaselessLiteral,
@@ -21,6 +22,8 @@ from pyparsing import (
     printables,
 )
 
+logger = getLogger(__name__)
+
 ParserElement.setDefaultWhitespaceChars("")  # Whitespace is in the grammar
 
 # Parser for SPF records.
@@ -150,6 +153,6 @@ def parse(spf_record):
     except ParseException:
         parsed = None
     except Exception as e:
-        print(f"{e.__class__.__name__}: {e}")
+        logger.warning("%s: %s", e.__class__.__name__, e)
         parsed = None
     return parsed
@@ -27,15 +27,10 @@ def run(
                 if mechanism.startswith(("ip4:", "ip6:")):
                     yield from parse_ip_qualifiers(mechanism, input_ooi, spf_record)
                 # a mechanisms and mx mechanisms have the same syntax
-                if mechanism.startswith("a") or mechanism.startswith("mx"):
+                if mechanism.startswith(("a", "mx")):
                     yield from parse_a_mx_qualifiers(mechanism, input_ooi, spf_record)
                 # exists ptr and include mechanisms have a similar syntax
-                if (
-                    mechanism.startswith("exists")
-                    or mechanism.startswith("ptr")
-                    or mechanism.startswith("include")
-                    or mechanism.startswith("?include")
-                ):
+                if mechanism.startswith(("exists", "ptr", "include", "?include")):
                     yield from parse_ptr_exists_include_mechanism(mechanism, input_ooi, spf_record)
                 # redirect mechanisms
                 if mechanism.startswith("redirect"):
@@ -90,7 +85,7 @@ def parse_a_mx_qualifiers(mechanism: str, input_ooi: DNSTXTRecord, spf_record: D
         yield DNSSPFMechanismHostname(
             spf_record=spf_record.reference, hostname=hostname.reference, mechanism=mechanism_type
         )
-    if mechanism.startswith("a/") or mechanism.startswith("mx/"):
+    if mechanism.startswith(("a/", "mx/")):
         mechanism_type, domain = mechanism.split("/", 1)[1]
         # TODO: fix prefix lengths
         domain = domain.split("/")[0]
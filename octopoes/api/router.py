@@ -9,7 +9,7 @@ from requests import RequestException, HTTPError
 
 from octopoes.api.models import ServiceHealth, ValidatedObservation, ValidatedDeclaration
 from octopoes.config.settings import Settings, XTDBType
-from octopoes.core.app import bootstrap_octopoes, get_xtdb_client
+from octopoes.core.app import bootstrap_octopoes, get_xtdb_client, get_xtdb_admin_client
 from octopoes.core.service import OctopoesService
 from octopoes.models import (
     OOI,
@@ -28,7 +28,7 @@ from octopoes.models.pagination import Paginated
 from octopoes.models.tree import ReferenceTree
 from octopoes.models.types import type_by_name
 from octopoes.version import __version__
-from octopoes.xtdb.client import XTDBHTTPClient, XTDBSession
+from octopoes.xtdb.client import XTDBSession
 
 logger = getLogger(__name__)
 router = APIRouter(prefix="/{client}")
@@ -256,7 +256,7 @@ def create_node(
 ) -> None:
     if settings.xtdb_type != XTDBType.XTDB_MULTINODE:
         raise Exception("Creating nodes requires XTDB_MULTINODE")
-    xtdb_client = XTDBHTTPClient(f"{settings.xtdb_uri}/_xtdb")
+    xtdb_client = get_xtdb_admin_client(settings.xtdb_uri)
     xtdb_client.create_node(client)
 
 
@@ -267,7 +267,7 @@ def delete_node(
 ) -> None:
     if settings.xtdb_type != XTDBType.XTDB_MULTINODE:
         raise Exception("Deleting nodes requires XTDB_MULTINODE")
-    xtdb_client = XTDBHTTPClient(f"{settings.xtdb_uri}/_xtdb")
+    xtdb_client = get_xtdb_admin_client(settings.xtdb_uri)
     try:
         xtdb_client.delete_node(client)
     except HTTPError as e:
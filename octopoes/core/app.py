@@ -1,7 +1,9 @@
+from functools import lru_cache
 from typing import Tuple, Optional
 
 import pika
 from pika import BlockingConnection
+from pika.adapters.blocking_connection import BlockingChannel
 
 from octopoes.config.settings import Settings, XTDBType
 from octopoes.core.service import OctopoesService
@@ -11,9 +13,17 @@ from octopoes.repositories.origin_parameter_repository import XTDBOriginParamete
 from octopoes.repositories.origin_repository import XTDBOriginRepository
 from octopoes.repositories.scan_profile_repository import XTDBScanProfileRepository
 from octopoes.tasks.app import app as celery_app
-from octopoes.xtdb.client import XTDBHTTPClient, XTDBSession
+from octopoes.xtdb.client import XTDBHTTPClient, XTDBHTTPSession, XTDBSession
 
 
+@lru_cache(maxsize=None)
+def get_xtdb_http_session(base_uri: str) -> XTDBHTTPSession:
+    """One HTTP session per XTDB host, so all nodes share its connection pool between requests and tasks"""
+    return XTDBHTTPSession()
+
+
+# The client name comes from the request path, so bound the cache. Clients are cheap: they only hold the node URL
+@lru_cache(maxsize=128)
 def get_xtdb_client(base_uri: str, client: str, xtdb_type: XTDBType) -> XTDBHTTPClient:
     parts = [base_uri]
     if xtdb_type == XTDBType.XTDB_MULTINODE:
@@ -26,19 +36,42 @@ def get_xtdb_client(base_uri: str, client: str, xtdb_type: XTDBType) -> XTDBHTTP
         if client != "_dev":
             parts.append(client)
         parts.append(f"_{xtdb_type.value}")
-    return XTDBHTTPClient("/".join(parts))
+    return XTDBHTTPClient("/".join(parts), get_xtdb_http_session(base_uri))
+
+
+@lru_cache(maxsize=None)
+def get_xtdb_admin_client(base_uri: str) -> XTDBHTTPClient:
+    """Client for the XTDB multinode endpoints that manage the nodes themselves"""
+    return XTDBHTTPClient(f"{base_uri}/_xtdb", get_xtdb_http_session(base_uri))
+
+
+def get_rabbit_channel(queue_uri: str) -> BlockingChannel:
+    rabbit_connection = pika.BlockingConnection(pika.URLParameters(queue_uri))
+    channel = rabbit_connection.channel()
+    channel.queue_declare(queue="create_events", durable=True)
+    return channel
 
 
 def bootstrap_octopoes(
-    settings: Settings, client: str, xtdb_session: Optional[XTDBSession] = None
-) -> Tuple[OctopoesService, XTDBHTTPClient, XTDBSession, BlockingConnection]:
+    settings: Settings,
+    client: str,
+    xtdb_session: Optional[XTDBSession] = None,
+    channel: Optional[BlockingChannel] = None,
+) -> Tuple[OctopoesService, XTDBHTTPClient, XTDBSession, Optional[BlockingConnection]]:
+    """Wire up an OctopoesService for a client.
+
+    Without a channel a new RabbitMQ connection is opened and returned, the caller owns it and must close it.
+    When a channel is passed its connection stays with whoever opened it and None is returned, so a shared
+    connection is never closed by accident.
+    """
     xtdb_client = get_xtdb_client(settings.xtdb_uri, client, settings.xtdb_type)
     if xtdb_session is None:
         xtdb_session = XTDBSession(xtdb_client)
 
-    rabbit_connection = pika.BlockingConnection(pika.URLParameters(settings.queue_uri))
-    channel = rabbit_connection.channel()
-    channel.queue_declare(queue="create_events", durable=True)
+    rabbit_connection = None
+    if channel is None:
+        channel = get_rabbit_channel(settings.queue_uri)
+        rabbit_connection = channel.connection
 
     event_manager = EventManager(client, celery_app, settings.queue_name_octopoes, channel)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+from functools import lru_cache
 from enum import Enum, IntEnum
 from typing import (
     List,
@@ -13,6 +14,7 @@ from typing import (
     Set,
     Union,
     Tuple,
+    Callable,
 )
 
 from pydantic import BaseModel, Field
@@ -44,6 +46,10 @@ class ScanProfileBase(BaseModel, abc.ABC):
     reference: Reference
     level: ScanLevel
 
+    class Config:
+        # Scan profiles are never mutated in place, so OOIs can share them instead of copying on validation
+        copy_on_model_validation = "none"
+
     def __eq__(self, other):
         if isinstance(other, ScanProfileBase) and self.__class__ == other.__class__:
             return self.reference == other.reference and self.level == other.level
@@ -91,7 +97,9 @@ class OOI(BaseModel, abc.ABC):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.primary_key = f"{self.get_object_type()}|{self.natural_key}"
+        # The primary key derives from already validated fields, so skip pydantic's __setattr__ checks
+        object.__setattr__(self, "primary_key", f"{self.get_object_type()}|{self.natural_key}")
+        self.__fields_set__.add("primary_key")
 
     def __str__(self):
         return self.primary_key
@@ -116,22 +124,7 @@ class OOI(BaseModel, abc.ABC):
 
     @property
     def natural_key(self) -> str:
-        parts = []
-
-        for attr in self._natural_key_attrs:
-            part = getattr(self, attr)
-            if part is None:
-                part = ""
-            if isinstance(part, Reference):
-                part = part.natural_key
-            elif isinstance(part, Enum):
-                part = str(part.value)
-            else:
-                part = str(part)
-
-            parts.append(part)
-
-        return "|".join(parts)
+        return "|".join(_format_natural_key_part(getattr(self, attr)) for attr in self._natural_key_attrs)
 
     def get_information_id(self) -> str:
         def format_attr(value_: Any) -> str:
@@ -156,15 +149,14 @@ class OOI(BaseModel, abc.ABC):
     @classmethod
     def get_tokenized_primary_key(cls, natural_key: str):
         token_tree = build_token_tree(cls)
-        natural_key_parts = natural_key.split("|")
+        # reversed, so parts can be consumed from the end in natural key order
+        natural_key_parts = natural_key.split("|")[::-1]
 
-        def hydrate(node) -> Union[Dict, str]:
-            for key, value in node.items():
-                if isinstance(value, dict):
-                    node[key] = hydrate(value)
-                else:
-                    node[key] = natural_key_parts.pop(0)
-            return node
+        def hydrate(node: Dict) -> Dict:
+            return {
+                key: hydrate(value) if isinstance(value, dict) else natural_key_parts.pop()
+                for key, value in node.items()
+            }
 
         return PrimaryKeyToken.parse_obj(hydrate(token_tree))
 
@@ -189,8 +181,8 @@ class Reference(str):
 
     @classmethod
     def parse(cls, ref_str: str) -> Tuple[str, str]:
-        object_type, *natural_key_parts = ref_str.split("|")
-        return object_type, "|".join(natural_key_parts)
+        object_type, _, natural_key = ref_str.partition("|")
+        return object_type, natural_key
 
     @property
     def class_(self) -> str:
@@ -214,7 +206,7 @@ class Reference(str):
 
     @property
     def human_readable(self) -> str:
-        return self.class_type.format_reference_human_readable(self)
+        return format_reference_human_readable(self.class_type, self)
 
     @classmethod
     def __get_validators__(cls):
@@ -240,6 +232,26 @@ class Reference(str):
         return cls(ref_str)
 
 
+# Exact type lookups for the common natural key values, before falling back to isinstance checks
+_NATURAL_KEY_PART_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    type(None): lambda _: "",
+    Reference: lambda reference: reference.natural_key,
+}
+
+
+def _format_natural_key_part(value: Any) -> str:
+    formatter = _NATURAL_KEY_PART_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, Reference):
+        return value.natural_key
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
 def format_id_short(id_: str) -> str:
     """Format the id in a short way. > 33 characters, interpolate with ..."""
     if len(id_) > 33:
@@ -264,24 +276,17 @@ def get_leaf_subclasses(cls: Type[OOI]) -> Set[Type[OOI]]:
     return set().union(*child_sets)
 
 
-def build_token_tree(ooi_class: Type[OOI]) -> Dict:
-    tokens = {}
-
-    for attribute in ooi_class._natural_key_attrs:
-        field = ooi_class.__fields__[attribute]
-        value = ""
-
-        if field.type_ == Reference:
-            from octopoes.models.types import related_object_type
+@lru_cache(maxsize=8192)
+def format_reference_human_readable(ooi_class: Type[OOI], reference: Reference) -> str:
+    """Format a reference for display. References are immutable, so the result is cached per class and reference."""
+    return ooi_class.format_reference_human_readable(reference)
 
-            related_class = related_object_type(field)
-            trees = [build_token_tree(related_class) for related_class in get_leaf_subclasses(related_class)]
 
-            # combine trees
-            value = {key: value_ for tree in trees for key, value_ in tree.items()}
+# FIXME: Legacy import location, the token trees are built and cached next to ALL_TYPES in octopoes.models.types
+def build_token_tree(ooi_class: Type[OOI]) -> Dict:
+    from octopoes.models.types import build_token_tree as build_cached_token_tree
 
-        tokens[attribute] = value
-    return tokens
+    return build_cached_token_tree(ooi_class)
 
 
 DeclaredScanProfile.update_forward_refs()
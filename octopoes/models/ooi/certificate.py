@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Literal
 
 from octopoes.models import OOI, Reference
@@ -10,6 +11,12 @@ from octopoes.models.ooi.network import IPAddress
 from octopoes.models.persistence import ReferenceField
 
 
+# Certificates are re-evaluated by bits over and over, so parse each validity timestamp only once
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp: str) -> datetime:
+    return datetime.fromisoformat(timestamp)
+
+
 class AlgorithmType(Enum):
     RSA = "RSA"
     ECC = "ECC"
@@ -35,7 +42,7 @@ class X509Certificate(OOI):
 
     @property
     def expired(self):
-        return datetime.now() > datetime.fromisoformat(self.valid_until)
+        return datetime.now() > _parse_timestamp(self.valid_until)
 
     _reverse_relation_names = {
         "signed_by": "signed_certificates",
@@ -43,7 +50,8 @@ class X509Certificate(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return f"{reference.tokenized.issuer} ({reference.tokenized.serial_number})"
+        t = reference.tokenized
+        return f"{t.issuer} ({t.serial_number})"
 
 
 class SubjectAlternativeName(OOI):
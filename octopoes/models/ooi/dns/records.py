@@ -26,8 +26,9 @@ class DNSRecord(OOI, abc.ABC):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
+        t = reference.tokenized
         dns_record_type = cls._get_record_type()
-        return f"{reference.tokenized.hostname.name} {dns_record_type} {reference.tokenized.value}"
+        return f"{t.hostname.name} {dns_record_type} {t.value}"
 
 
 class DNSARecord(DNSRecord):
@@ -121,8 +122,9 @@ class DNSSOARecord(DNSRecord):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
+        t = reference.tokenized
         dns_record_type = cls._get_record_type()
-        return f"{reference.tokenized.hostname.name} {dns_record_type} {reference.tokenized.soa_hostname.name}"
+        return f"{t.hostname.name} {dns_record_type} {t.soa_hostname.name}"
 
 
 class NXDOMAIN(OOI):
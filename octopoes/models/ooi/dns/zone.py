@@ -86,7 +86,8 @@ class ResolvedHostname(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return f"{reference.tokenized.hostname.name} -> {reference.tokenized.address.address}"
+        t = reference.tokenized
+        return f"{t.hostname.name} -> {t.address.address}"
 
 
 Hostname.update_forward_refs()
@@ -50,10 +50,8 @@ class DNSSPFMechanismIP(DNSSPFMechanism):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return (
-            f"SPF Record of {reference.tokenized.spf_record.dns_txt_record.hostname.name}"
-            + f"{reference.tokenized.mechanism} {reference.tokenized.ip.address}"
-        )
+        t = reference.tokenized
+        return f"SPF Record of {t.spf_record.dns_txt_record.hostname.name}{t.mechanism} {t.ip.address}"
 
 
 class DNSSPFMechanismHostname(DNSSPFMechanism):
@@ -69,10 +67,8 @@ class DNSSPFMechanismHostname(DNSSPFMechanism):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return (
-            f"SPF Record of {reference.tokenized.spf_record.dns_txt_record.hostname.name} "
-            + f"{reference.tokenized.mechanism} {reference.tokenized.hostname.name}"
-        )
+        t = reference.tokenized
+        return f"SPF Record of {t.spf_record.dns_txt_record.hostname.name} {t.mechanism} {t.hostname.name}"
 
 
 class DNSSPFMechanismNetBlock(DNSSPFMechanism):
@@ -88,10 +84,10 @@ class DNSSPFMechanismNetBlock(DNSSPFMechanism):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
+        t = reference.tokenized
         return (
-            f"SPF Record of {reference.tokenized.spf_record.dns_txt_record.hostname.name} "
-            + f" {reference.tokenized.mechanism} {reference.tokenized.netblock.start_ip}"
-            f"/{reference.tokenized.netblock.mask}"
+            f"SPF Record of {t.spf_record.dns_txt_record.hostname.name}  "
+            f"{t.mechanism} {t.netblock.start_ip}/{t.netblock.mask}"
         )
 
 
@@ -137,7 +133,8 @@ class DKIMSelector(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return f"{reference.tokenized.selector} DKIM selector of {reference.tokenized.hostname.name}"
+        t = reference.tokenized
+        return f"{t.selector} DKIM selector of {t.hostname.name}"
 
 
 class DKIMKey(OOI):
@@ -152,7 +149,5 @@ class DKIMKey(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return (
-            f"DKIM key of {reference.tokenized.dkim_selector.selector} on "
-            f"{reference.tokenized.dkim_selector.hostname.name}"
-        )
+        t = reference.tokenized
+        return f"DKIM key of {t.dkim_selector.selector} on {t.dkim_selector.hostname.name}"
@@ -121,7 +121,8 @@ class NetBlock(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return f"{reference.tokenized.start_ip.address}/{reference.tokenized.mask}"
+        t = reference.tokenized
+        return f"{t.start_ip.address}/{t.mask}"
 
 
 class IPV6NetBlock(NetBlock):
@@ -17,10 +17,11 @@ class Software(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        version = reference.tokenized.version
+        t = reference.tokenized
+        version = t.version
         if version != "":
             version = f" {version}"
-        return f"{reference.tokenized.name}{version}"
+        return f"{t.name}{version}"
 
 
 class SoftwareInstance(OOI):
@@ -102,13 +102,7 @@ class HTTPResource(OOI):
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
         t = reference.tokenized
-        port = f":{t.web_url.port}"
-        try:
-            netloc = t.web_url.netloc.address
-        except KeyError:
-            netloc = t.web_url.netloc.name
-
-        web_url = f"{t.web_url.scheme}://{netloc}{port}{t.web_url.path}"
+        web_url = format_web_url_token(t.web_url)
         address = t.website.ip_service.ip_port.address.address
 
         return f"{web_url} @ {address}"
@@ -129,16 +123,10 @@ class HTTPHeader(OOI):
     def format_reference_human_readable(cls, reference: Reference) -> str:
         t = reference.tokenized
 
-        port = f":{t.resource.web_url.port}" if t.resource.web_url.port else ""
-        try:
-            netloc = t.resource.web_url.netloc.address
-        except KeyError:
-            netloc = t.resource.web_url.netloc.name
-
-        web_url = f"{t.resource.web_url.scheme}://{netloc}{port}{t.resource.web_url.path}"
+        web_url = format_web_url_token(t.resource.web_url)
         address = t.resource.website.ip_service.ip_port.address.address
 
-        return f"{reference.tokenized.key} @ {web_url} @ {address}"
+        return f"{t.key} @ {web_url} @ {address}"
 
 
 class URL(OOI):
@@ -155,7 +143,8 @@ class URL(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        return f"{reference.tokenized.raw} @{reference.tokenized.network.name}"
+        t = reference.tokenized
+        return f"{t.raw} @{t.network.name}"
 
 
 class HTTPHeaderURL(OOI):
@@ -169,18 +158,13 @@ class HTTPHeaderURL(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        t = reference.tokenized.header
-
-        port = f":{t.resource.web_url.port}" if t.resource.web_url.port else ""
-        try:
-            netloc = t.resource.web_url.netloc.address
-        except KeyError:
-            netloc = t.resource.web_url.netloc.name
+        tokenized = reference.tokenized
+        t = tokenized.header
 
-        web_url = f"{t.resource.web_url.scheme}://{netloc}{port}{t.resource.web_url.path}"
+        web_url = format_web_url_token(t.resource.web_url)
         address = t.resource.website.ip_service.ip_port.address.address
 
-        return f"{t.key} @ {web_url} @ {address} contains {str(reference.tokenized.url.raw)}"
+        return f"{t.key} @ {web_url} @ {address} contains {str(tokenized.url.raw)}"
 
 
 class HTTPHeaderHostname(OOI):
@@ -194,18 +178,13 @@ class HTTPHeaderHostname(OOI):
 
     @classmethod
     def format_reference_human_readable(cls, reference: Reference) -> str:
-        t = reference.tokenized.header
-
-        port = f":{t.resource.web_url.port}" if t.resource.web_url.port else ""
-        try:
-            netloc = t.resource.web_url.netloc.address
-        except KeyError:
-            netloc = t.resource.web_url.netloc.name
+        tokenized = reference.tokenized
+        t = tokenized.header
 
-        web_url = f"{t.resource.web_url.scheme}://{netloc}{port}{t.resource.web_url.path}"
+        web_url = format_web_url_token(t.resource.web_url)
         address = t.resource.website.ip_service.ip_port.address.address
 
-        return f"{t.key} @ {web_url} @ {address} contains {str(reference.tokenized.hostname.name)}"
+        return f"{t.key} @ {web_url} @ {address} contains {str(tokenized.hostname.name)}"
 
 
 class ImageMetadata(OOI):
@@ -221,13 +200,7 @@ class ImageMetadata(OOI):
     def format_reference_human_readable(cls, reference: Reference) -> str:
         t = reference.tokenized
 
-        port = f":{t.resource.web_url.port}" if t.resource.web_url.port else ""
-        try:
-            netloc = t.resource.web_url.netloc.address
-        except KeyError:
-            netloc = t.resource.web_url.netloc.name
-
-        web_url = f"{t.resource.web_url.scheme}://{netloc}{port}{t.resource.web_url.path}"
+        web_url = format_web_url_token(t.resource.web_url)
         address = t.resource.website.ip_service.ip_port.address.address
 
         return f"{web_url} @ {address}"
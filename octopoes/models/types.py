@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Type, Dict, Set, Iterator, Union
+from typing import Type, Dict, Set, Iterator, Union, Tuple
 
+from pydantic import Field
 from pydantic.fields import ModelField
+from typing_extensions import Annotated
 
-from octopoes.models import OOI, Reference
+from octopoes.models import OOI, Reference, get_leaf_subclasses
 from octopoes.models.ooi.certificate import (
     X509Certificate,
     SubjectAlternativeNameHostname,
@@ -133,22 +135,26 @@ EmailSecurityType = Union[
 ]
 MonitoringType = Union[Application, Incident]
 
-OOIType = Union[
-    CertificateType,
-    DnsType,
-    DnsRecordType,
-    NetworkType,
-    ServiceType,
-    SoftwareType,
-    WebType,
-    DNSSPFMechanismIP,
-    DNSSPFMechanismHostname,
-    DNSSPFMechanismNetBlock,
-    DNSSPFRecord,
-    MonitoringType,
-    EmailSecurityType,
-    Finding,
-    FindingTypeType,
+# Discriminate on object_type, so parsing looks up the model class instead of trying each member in turn
+OOIType = Annotated[
+    Union[
+        CertificateType,
+        DnsType,
+        DnsRecordType,
+        NetworkType,
+        ServiceType,
+        SoftwareType,
+        WebType,
+        DNSSPFMechanismIP,
+        DNSSPFMechanismHostname,
+        DNSSPFMechanismNetBlock,
+        DNSSPFRecord,
+        MonitoringType,
+        EmailSecurityType,
+        Finding,
+        FindingTypeType,
+    ],
+    Field(discriminator="object_type"),
 ]
 
 
@@ -161,42 +167,70 @@ def get_all_types(cls_: Type[OOI]) -> Iterator[Type[OOI]]:
 ALL_TYPES = set(get_all_types(OOI))
 
 
+_types_caches: Tuple[Set[Type[OOI]], Dict[str, Dict]] = (set(), {})
+
+
+def _types_cache(name: str) -> Dict:
+    """Return the named cache of values derived from ALL_TYPES, emptied whenever ALL_TYPES is replaced"""
+    global _types_caches
+
+    source, caches = _types_caches
+    if source is not ALL_TYPES:
+        caches = {}
+        _types_caches = ALL_TYPES, caches
+    return caches.setdefault(name, {})
+
+
+def _split_types() -> Tuple[Set[Type[OOI]], Set[Type[OOI]]]:
+    """Split ALL_TYPES into abstract and concrete types once. The sets are shared and must not be mutated."""
+    split = _types_cache("split_types")
+    if not split:
+        split["abstract"] = {t for t in ALL_TYPES if t.__subclasses__()}
+        split["concrete"] = ALL_TYPES - split["abstract"]
+    return split["abstract"], split["concrete"]
+
+
 def get_abstract_types() -> Set[Type[OOI]]:
-    return {t for t in ALL_TYPES if t.__subclasses__()}
+    return set(_split_types()[0])
 
 
 def get_concrete_types() -> Set[Type[OOI]]:
-    return {t for t in ALL_TYPES if not t.__subclasses__()}
+    return set(_split_types()[1])
 
 
 def get_collapsed_types() -> Set[Type[OOI]]:
-    abstract_ooi_subtypes = get_abstract_types() - {OOI}
+    abstract_types, concrete_types = _split_types()
+    abstract_ooi_subtypes = abstract_types - {OOI}
 
     subclasses_of_abstract_ooi: Set[Type[OOI]] = set()
 
-    for concrete_type in get_concrete_types():
+    for concrete_type in concrete_types:
         for abstract_type in abstract_ooi_subtypes:
             if issubclass(concrete_type, abstract_type):
                 subclasses_of_abstract_ooi.add(concrete_type)
 
-    non_abstracted_concrete_types = get_concrete_types() - subclasses_of_abstract_ooi
+    non_abstracted_concrete_types = concrete_types - subclasses_of_abstract_ooi
 
     return abstract_ooi_subtypes.union(non_abstracted_concrete_types)
 
 
 def to_concrete(object_types: Set[Type[OOI]]) -> Set[Type[OOI]]:
+    all_concrete_types = _split_types()[1]
+
     concrete_types = set()
     for object_type in object_types:
-        if object_type in get_concrete_types():
+        if object_type in all_concrete_types:
             concrete_types.add(object_type)
         else:
-            child_concrete_types = {t for t in get_concrete_types() if issubclass(t, object_type)}
-            concrete_types = concrete_types.union(child_concrete_types)
+            concrete_types.update(t for t in all_concrete_types if issubclass(t, object_type))
     return concrete_types
 
 
 def type_by_name(type_name: str):
-    return next(t for t in ALL_TYPES if t.__name__ == type_name)
+    index = _types_cache("type_by_name")
+    if not index:
+        index.update({t.__name__: t for t in ALL_TYPES})
+    return index[type_name]
 
 
 def related_object_type(field: ModelField) -> Type[OOI]:
@@ -207,14 +241,47 @@ def related_object_type(field: ModelField) -> Type[OOI]:
 
 
 def get_relations(object_type: Type[OOI]) -> Dict[str, Type[OOI]]:
-    return {
-        name: related_object_type(field) for name, field in object_type.__fields__.items() if field.type_ == Reference
-    }
+    """The result is cached per type and must not be mutated"""
+    relations = _types_cache("get_relations")
+    try:
+        return relations[object_type]
+    except KeyError:
+        relations[object_type] = {
+            name: related_object_type(field)
+            for name, field in object_type.__fields__.items()
+            if field.type_ == Reference
+        }
+        return relations[object_type]
 
 
 def get_relation(object_type: Type[OOI], property_name: str) -> Type[OOI]:
     return get_relations(object_type)[property_name]
 
 
+def build_token_tree(ooi_class: Type[OOI]) -> Dict:
+    """Build the natural key token tree of an OOI class. The result is cached per class and must not be mutated."""
+    token_trees = _types_cache("build_token_tree")
+    if ooi_class in token_trees:
+        return token_trees[ooi_class]
+
+    tokens = {}
+
+    for attribute in ooi_class._natural_key_attrs:
+        field = ooi_class.__fields__[attribute]
+        value = ""
+
+        if field.type_ == Reference:
+            related_class = related_object_type(field)
+            trees = [build_token_tree(related_class) for related_class in get_leaf_subclasses(related_class)]
+
+            # combine trees
+            value = {key: value_ for tree in trees for key, value_ in tree.items()}
+
+        tokens[attribute] = value
+
+    token_trees[ooi_class] = tokens
+    return tokens
+
+
 # FIXME: legacy imports
 OOI_TYPES = {ooi_type.get_object_type(): ooi_type for ooi_type in get_concrete_types()}
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Type, List, Optional, Set, Dict, Union, Any, Tuple
 
@@ -33,12 +34,18 @@ from octopoes.xtdb.related_field_generator import RelatedFieldNode
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def prefixed_field_names(ooi_type: Type[OOI]) -> Dict[str, str]:
+    return {name: f"{ooi_type.__name__}/{name}" for name in ooi_type.__fields__}
+
+
 def merge_ooi(ooi_new: OOI, ooi_old: OOI) -> Tuple[OOI, bool]:
-    data_old = ooi_old.dict()
-    data_new = ooi_new.dict()
+    # Shallow field copies: parse_obj validates the merged values, but nested scan profiles are not copied
+    # (copy_on_model_validation is "none"), so the merged OOI shares them with ooi_old and ooi_new
+    data_old = dict(ooi_old.__dict__)
 
     # Trim new None values
-    clean_new = {key: val for key, val in data_new.items() if val is not None}
+    clean_new = {key: val for key, val in ooi_new.__dict__.items() if val is not None}
 
     changed = False
     for key, value in clean_new.items():
@@ -159,12 +166,12 @@ class XTDBOOIRepository(OOIRepository):
     @classmethod
     def serialize(cls, ooi: OOI) -> Dict[str, Any]:
 
-        # export model with pydantic serializers
-        export = json.loads(ooi.json())
+        # export model with pydantic serializers, object_type is stored without prefix below
+        export = json.loads(ooi.json(exclude={"object_type"}))
 
-        # prefix fields, but not object_type
-        export.pop("object_type")
-        export = {f"{ooi.__class__.__name__}/{key}": value for key, value in export.items() if value is not None}
+        # prefix fields
+        field_names = prefixed_field_names(ooi.__class__)
+        export = {field_names[key]: value for key, value in export.items() if value is not None}
 
         export["object_type"] = ooi.__class__.__name__
         export[cls.pk_prefix()] = ooi.primary_key
@@ -181,7 +188,7 @@ class XTDBOOIRepository(OOIRepository):
         data.pop(cls.pk_prefix())
 
         # remove type prefixes
-        stripped = {key.split("/")[1]: value for key, value in data.items()}
+        stripped = {key.partition("/")[2]: value for key, value in data.items()}
         return object_cls.parse_obj(stripped)
 
     def get(self, reference: Reference, valid_time: datetime) -> OOI:
@@ -434,9 +441,9 @@ class XTDBOOIRepository(OOIRepository):
                         :in [[ _crux_db_id ... ]]
                         :where [[?e :crux.db/id _crux_db_id]]
                     }}
-                    :in-args [["{reference}"]]
+                    :in-args [[{reference}]]
                 }}""".format(
-            reference=reference, related_fields=" ".join(segment_query_sections)
+            reference=str_val(reference), related_fields=" ".join(segment_query_sections)
         )
 
         return query
@@ -2,14 +2,17 @@ import timeit
 import uuid
 from datetime import timezone, datetime
 from logging import getLogger, config
-from typing import Dict
+from typing import Dict, Optional
 
 import yaml
+from celery.signals import worker_process_shutdown
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPError
 from pydantic import parse_obj_as
 
 from octopoes.config.settings import Settings
 from octopoes.connector.katalogus import KATalogusClientV1
-from octopoes.core.app import bootstrap_octopoes
+from octopoes.core.app import bootstrap_octopoes, get_rabbit_channel
 from octopoes.events.events import EVENT_TYPE, DBEvent
 from octopoes.tasks.app import app
 
@@ -23,25 +26,69 @@ try:
 except FileNotFoundError:
     logger.warning(f"No log config found at: {settings.log_cfg}")
 
+katalogus_client = KATalogusClientV1(settings.katalogus_api)
+
+# A worker process runs tasks one at a time, so it can keep a single RabbitMQ channel open between tasks
+_rabbit_channel: Optional[BlockingChannel] = None
+
+
+def get_channel() -> BlockingChannel:
+    """Return the RabbitMQ channel of this worker, reconnecting if needed.
+
+    The channel and its connection are shared by all tasks of the worker: callers must never close either.
+    """
+    global _rabbit_channel
+
+    if _rabbit_channel is not None:
+        if _rabbit_channel.is_open:
+            try:
+                # Service heartbeats that were missed while idle, this raises if the broker dropped the connection
+                _rabbit_channel.connection.process_data_events()
+                return _rabbit_channel
+            except AMQPError:
+                logger.info("Lost connection to RabbitMQ, reconnecting")
+
+        # A closed channel can leave its connection open, close it so reconnecting does not leak it
+        _close_connection(_rabbit_channel)
+
+    _rabbit_channel = get_rabbit_channel(settings.queue_uri)
+    return _rabbit_channel
+
+
+def _close_connection(channel: BlockingChannel) -> None:
+    try:
+        if channel.connection.is_open:
+            channel.connection.close()
+    except AMQPError:
+        logger.debug("Could not close RabbitMQ connection cleanly", exc_info=True)
+
+
+@worker_process_shutdown.connect
+def close_channel(**kwargs) -> None:
+    global _rabbit_channel
+
+    if _rabbit_channel is not None:
+        _close_connection(_rabbit_channel)
+        _rabbit_channel = None
+
 
 @app.task(queue=settings.queue_name_octopoes)
 def handle_event(event: Dict):
     parsed_event: DBEvent = parse_obj_as(EVENT_TYPE, event)
 
     # bootstrap octopoes
-    octopoes, _, session, rabbit_connection = bootstrap_octopoes(settings, parsed_event.client)
+    octopoes, _, session, _ = bootstrap_octopoes(settings, parsed_event.client, channel=get_channel())
 
     # fire event
     octopoes.process_event(parsed_event)
 
     # teardown octopoes
     session.commit()
-    rabbit_connection.close()
 
 
 @app.task(queue=settings.queue_name_octopoes)
 def schedule_scan_profile_recalculations():
-    orgs = KATalogusClientV1(settings.katalogus_api).get_organisations()
+    orgs = katalogus_client.get_organisations()
 
     for org in orgs:
         app.send_task(
@@ -57,7 +104,7 @@ def schedule_scan_profile_recalculations():
 def recalculate_scan_profiles(org: str, *args, **kwargs):
 
     # bootstrap octopoes
-    octopoes, _, session, rabbit_connection = bootstrap_octopoes(settings, org)
+    octopoes, _, session, _ = bootstrap_octopoes(settings, org, channel=get_channel())
 
     # timer
     timer = timeit.default_timer()
@@ -66,6 +113,5 @@ def recalculate_scan_profiles(org: str, *args, **kwargs):
 
     # teardown octopoes
     session.commit()
-    rabbit_connection.close()
 
     logger.info("Finished scan profile recalculation [org=%s] [dur=%.2fs]", org, timeit.default_timer() - timer)
@@ -7,6 +7,7 @@ from typing import Union, Optional, Tuple, List, Dict, Any, Type, Callable
 import requests
 from pydantic import BaseModel, Field
 from requests import Response, HTTPError
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +31,16 @@ class Transaction(BaseModel):
 
 
 class XTDBHTTPSession(requests.Session):
-    def __init__(self, base_url: str):
+    def __init__(self, pool_maxsize: int = 40):
         super().__init__()
 
-        self._base_url = base_url
         self.headers["Accept"] = "application/json"
 
-    def request(self, method: str, url: Union[str, bytes], **kwargs) -> requests.Response:
-        return super().request(method, self._base_url + str(url), **kwargs)
+        # One session serves all nodes of an XTDB host and is shared between FastAPI's worker threads (40 by
+        # default), so this bounds the connections kept alive to that host as a whole
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
 
 
 class XTDBStatus(BaseModel):
@@ -51,8 +54,9 @@ class XTDBStatus(BaseModel):
 
 
 class XTDBHTTPClient:
-    def __init__(self, base_url):
-        self._session = XTDBHTTPSession(base_url)
+    def __init__(self, base_url: str, session: Optional[XTDBHTTPSession] = None):
+        self._base_url = base_url
+        self._session = session if session is not None else XTDBHTTPSession()
 
     @staticmethod
     def _verify_response(response: Response) -> None:
@@ -66,14 +70,16 @@ class XTDBHTTPClient:
             raise e
 
     def status(self) -> XTDBStatus:
-        res = self._session.get("/status")
+        res = self._session.get(f"{self._base_url}/status")
         self._verify_response(res)
         return XTDBStatus.parse_obj(res.json())
 
     def get_entity(self, entity_id: str, valid_time: Optional[datetime] = None) -> dict:
         if valid_time is None:
             valid_time = datetime.now(timezone.utc)
-        res = self._session.get("/entity", params={"eid": entity_id, "valid-time": valid_time.isoformat()})
+        res = self._session.get(
+            f"{self._base_url}/entity", params={"eid": entity_id, "valid-time": valid_time.isoformat()}
+        )
         self._verify_response(res)
         return res.json()
 
@@ -81,7 +87,7 @@ class XTDBHTTPClient:
         if valid_time is None:
             valid_time = datetime.now(timezone.utc)
         res = self._session.post(
-            "/query",
+            f"{self._base_url}/query",
             params={"valid-time": valid_time.isoformat()},
             data=query,
             headers={"Content-Type": "application/edn"},
@@ -90,12 +96,12 @@ class XTDBHTTPClient:
         return res.json()
 
     def await_transaction(self, transaction_id: int) -> None:
-        self._session.get("/await-tx", params={"txId": transaction_id})
+        self._session.get(f"{self._base_url}/await-tx", params={"txId": transaction_id})
         logger.info("Transaction completed [txId=%s]", transaction_id)
 
     def submit_transaction(self, operations: List[Operation]) -> None:
         res = self._session.post(
-            "/submit-tx",
+            f"{self._base_url}/submit-tx",
             data=Transaction(operations=operations).json(by_alias=True),
             headers={"Content-Type": "application/json"},
         )
@@ -104,13 +110,13 @@ class XTDBHTTPClient:
         self.await_transaction(res.json()["txId"])
 
     def create_node(self, name: str) -> None:
-        res = self._session.post("/create-node", json={"node": name})
+        res = self._session.post(f"{self._base_url}/create-node", json={"node": name})
 
         self._verify_response(res)
 
     def delete_node(self, name: str) -> None:
         res = self._session.post(
-            "/delete-node",
+            f"{self._base_url}/delete-node",
             json={"node": name},
         )
 
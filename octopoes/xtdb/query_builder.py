@@ -7,6 +7,8 @@ from octopoes.xtdb.related_field_generator import (
     FieldSet,
 )
 
+NON_ALPHANUMERIC = re.compile("[^0-9a-zA-Z]+")
+
 
 def join_csv(values: Iterator[any]) -> str:
     return " ".join(values)
@@ -38,7 +40,7 @@ def generate_pull_query(
         where = {}
     # Break where clause in relevant sections
     for key, value in where.items():
-        var_name = re.sub("[^0-9a-zA-Z]+", "_", key)
+        var_name = NON_ALPHANUMERIC.sub("_", key)
         if isinstance(value, (List, Set)):
             value = sorted([str_val(value) for value in value])
             _csv = join_csv(value)
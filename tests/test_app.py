@@ -0,0 +1,25 @@
+from octopoes.config.settings import XTDBType
+from octopoes.core.app import get_xtdb_admin_client, get_xtdb_client
+
+XTDB_URI = "http://xtdb:3000"
+
+
+def test_xtdb_client_is_reused():
+    client = get_xtdb_client(XTDB_URI, "org", XTDBType.XTDB_MULTINODE)
+
+    assert get_xtdb_client(XTDB_URI, "org", XTDBType.XTDB_MULTINODE) is client
+
+
+def test_xtdb_clients_share_a_session_per_host():
+    client = get_xtdb_client(XTDB_URI, "org", XTDBType.XTDB_MULTINODE)
+    other_client = get_xtdb_client(XTDB_URI, "other_org", XTDBType.XTDB_MULTINODE)
+
+    assert other_client is not client
+    assert other_client._session is client._session
+    assert get_xtdb_admin_client(XTDB_URI)._session is client._session
+    assert get_xtdb_client("http://other-xtdb:3000", "org", XTDBType.XTDB_MULTINODE)._session is not client._session
+
+
+def test_xtdb_client_node_url():
+    assert get_xtdb_client(XTDB_URI, "org", XTDBType.XTDB_MULTINODE)._base_url == f"{XTDB_URI}/_xtdb/org"
+    assert get_xtdb_client(XTDB_URI, "_dev", XTDBType.CRUX)._base_url == f"{XTDB_URI}/_crux"
@@ -0,0 +1,69 @@
+from requests import Session
+
+from bits.missing_spf import missing_spf
+from bits.missing_spf.missing_spf import extract_domain, run
+from octopoes.models import Reference
+from octopoes.models.ooi.dns.zone import Hostname
+from octopoes.models.ooi.email_security import DNSSPFRecord
+from octopoes.models.ooi.findings import Finding, KATFindingType
+
+NETWORK_REFERENCE = Reference.from_str("Network|internet")
+
+
+def fqdn_hostname(name: str) -> Hostname:
+    return Hostname(network=NETWORK_REFERENCE, name=name, fqdn=Reference.from_str(f"Hostname|internet|{name}"))
+
+
+def test_missing_spf_domain():
+    hostname = fqdn_hostname("example.com.")
+
+    results = list(run(hostname, []))
+
+    ft = KATFindingType(id="KAT-NO-SPF")
+    assert results == [
+        ft,
+        Finding(
+            ooi=hostname.reference, finding_type=ft.reference, description="This hostname does not have an SPF record"
+        ),
+    ]
+
+
+def test_missing_spf_subdomain():
+    assert list(run(fqdn_hostname("www.example.com."), [])) == []
+
+
+def test_missing_spf_tld():
+    assert list(run(fqdn_hostname("com."), [])) == []
+
+
+def test_missing_spf_not_fqdn(mocker):
+    extract = mocker.patch.object(missing_spf, "extract_domain")
+    hostname = Hostname(
+        network=NETWORK_REFERENCE, name="example.com", fqdn=Reference.from_str("Hostname|internet|example.com.")
+    )
+
+    assert list(run(hostname, [])) == []
+    extract.assert_not_called()
+
+
+def test_missing_spf_with_spf_record():
+    hostname = fqdn_hostname("example.com.")
+    spf_record = DNSSPFRecord(
+        dns_txt_record=Reference.from_str("DNSTXTRecord|internet|example.com.|v=spf1 ~all"), value="v=spf1 ~all"
+    )
+
+    assert list(run(hostname, [spf_record])) == []
+
+
+def test_missing_spf_uses_bundled_suffix_list(mocker):
+    send = mocker.patch.object(Session, "send", side_effect=AssertionError("suffix list fetched over HTTP"))
+    # Force the suffix list to be loaded again, in case an earlier test already did
+    mocker.patch.object(missing_spf.tld_extractor, "_extractor", None)
+    extract_domain.cache_clear()
+
+    extracted = extract_domain("example.co.uk.")
+
+    assert extracted.domain == "example"
+    assert extracted.suffix == "co.uk"
+    send.assert_not_called()
+    assert list(run(fqdn_hostname("example.co.uk."), []))[0] == KATFindingType(id="KAT-NO-SPF")
@@ -5,10 +5,12 @@ from octopoes.models.ooi.email_security import DNSSPFRecord, DNSSPFMechanismIP
 from octopoes.models.ooi.findings import KATFindingType
 from octopoes.models.ooi.network import IPAddressV4
 
+HOSTNAME_REFERENCE = Reference.from_str("Hostname|internet|example.com.")
+
 
 def test_spf_discovery_simple_success():
     dnstxt_record = DNSTXTRecord(
-        hostname=Reference.from_str("Hostname|internet|example.com."),
+        hostname=HOSTNAME_REFERENCE,
         value="v=spf1 ip4:1.1.1.1 ~all exp=explain._spf.example.com",
     )
 
@@ -22,27 +24,24 @@ def test_spf_discovery_simple_success():
         exp="explain._spf.example.com",
     )
 
-    assert results[-1].dict() == spf_record.dict()
+    assert results[-1] == spf_record
 
-    assert results[0].dict() == IPAddressV4(address="1.1.1.1", network=Reference.from_str("Network|internet")).dict()
+    assert results[0] == IPAddressV4(address="1.1.1.1", network=Reference.from_str("Network|internet"))
 
-    assert (
-        results[1].dict()
-        == DNSSPFMechanismIP(
-            ip=Reference.from_str("IPAddressV4|internet|1.1.1.1"), spf_record=spf_record.reference, mechanism="ip4"
-        ).dict()
+    assert results[1] == DNSSPFMechanismIP(
+        ip=Reference.from_str("IPAddressV4|internet|1.1.1.1"), spf_record=spf_record.reference, mechanism="ip4"
     )
 
 
 def test_spf_discovery_invalid_():
     dnstxt_record = DNSTXTRecord(
-        hostname=Reference.from_str("Hostname|internet|example.com."),
+        hostname=HOSTNAME_REFERENCE,
         value="v=spf1 assdfsdf w rgw",
     )
 
     results = list(run(dnstxt_record, []))
 
-    assert results[0].dict() == KATFindingType(id="KAT-INVALID-SPF")
+    assert results[0] == KATFindingType(id="KAT-INVALID-SPF")
 
 
 def test_spf_discovery_intermediate_success():
@@ -9,10 +9,10 @@ from octopoes.config.settings import XTDBType
 from octopoes.events.manager import EventManager
 from octopoes.models import Reference, OOI
 from octopoes.models.persistence import ReferenceField
-from octopoes.models.ooi.dns.zone import DNSZone
+from octopoes.models.ooi.dns.zone import DNSZone, Hostname
 from octopoes.models.ooi.network import IPAddressV4, Network
 from octopoes.models.path import Segment, Path, Direction
-from octopoes.repositories.ooi_repository import XTDBOOIRepository
+from octopoes.repositories.ooi_repository import XTDBOOIRepository, merge_ooi
 from octopoes.xtdb.client import XTDBSession, XTDBHTTPClient
 from tests.mocks.mock_ooi_types import ALL_OOI_TYPES, MockIPAddressV4, MockIPPort, MockIPAddress, MockNetwork
 
@@ -87,6 +87,14 @@ class OOIRepositoryTest(TestCase):
 
         self.assertEqual(re.sub(r"\s+", " ", expected_query), re.sub(r"\s+", " ", query))
 
+    @patch("octopoes.models.types.ALL_TYPES", ALL_OOI_TYPES)
+    def test_construct_neighbour_query_escapes_reference(self):
+        reference = Reference.from_str('MockHostname|internet|exa"mple.com')
+
+        query = self.repository.construct_neighbour_query(reference)
+
+        self.assertIn(':in-args [["MockHostname|internet|exa\\"mple.com"]]', query)
+
     @patch("octopoes.models.types.ALL_TYPES", ALL_OOI_TYPES)
     def test_encode_outgoing_segment(self):
         path = Path.parse("MockIPAddressV4.network")
@@ -135,3 +143,25 @@ class OOIRepositoryTest(TestCase):
 
         resolved_hostname = neighbours[Path.parse("MockHostname.<hostname[is MockResolvedHostname]")][0]
         self.assertEqual(Reference.from_str("MockIPAddressV4|internet|1.1.1.1"), resolved_hostname.address)
+
+    def test_merge_ooi_keeps_old_values_for_unset_fields(self):
+        internet = Network(name="internet")
+        dns_zone = Reference.from_str("DNSZone|internet|example.com.")
+        old = Hostname(network=internet.reference, name="example.com.", dns_zone=dns_zone)
+        new = Hostname(network=internet.reference, name="example.com.")
+
+        merged, changed = merge_ooi(new, old)
+
+        self.assertFalse(changed)
+        self.assertEqual(dns_zone, merged.dns_zone)
+
+    def test_merge_ooi_detects_changed_values(self):
+        internet = Network(name="internet")
+        dns_zone = Reference.from_str("DNSZone|internet|example.com.")
+        old = Hostname(network=internet.reference, name="example.com.")
+        new = Hostname(network=internet.reference, name="example.com.", dns_zone=dns_zone)
+
+        merged, changed = merge_ooi(new, old)
+
+        self.assertTrue(changed)
+        self.assertEqual(dns_zone, merged.dns_zone)
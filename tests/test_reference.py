@@ -2,7 +2,7 @@ from ipaddress import ip_address
 from unittest import TestCase
 from unittest.mock import patch
 
-from octopoes.models import Reference
+from octopoes.models import Reference, format_reference_human_readable
 from tests.mocks.mock_ooi_types import ALL_OOI_TYPES, MockNetwork, MockIPAddressV4
 
 
@@ -28,3 +28,18 @@ class ReferenceTest(TestCase):
     def test_parse_obj(self):
         ip = MockIPAddressV4.parse_obj({"address": "1.1.1.1", "network": "MockNetwork|internet"})
         self.assertEqual(Reference("MockNetwork|internet"), ip.network)
+
+    def test_human_readable(self):
+        format_reference_human_readable.cache_clear()
+
+        self.assertEqual("MockNetwork|internet", Reference("MockNetwork|internet").human_readable)
+        self.assertEqual("MockNetwork|internet", Reference("MockNetwork|internet").human_readable)
+
+        cache_info = format_reference_human_readable.cache_info()
+        self.assertEqual(1, cache_info.misses)
+        self.assertEqual(1, cache_info.hits)
+
+    def test_natural_key(self):
+        ip_reference = Reference("MockIPAddressV4|internet|1.1.1.1")
+        self.assertEqual("MockIPAddressV4", ip_reference.class_)
+        self.assertEqual("internet|1.1.1.1", ip_reference.natural_key)
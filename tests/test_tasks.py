@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+from pika.exceptions import StreamLostError
+
+from octopoes.core.app import bootstrap_octopoes
+from octopoes.tasks import tasks
+
+
+@pytest.fixture
+def rabbit_channel(mocker):
+    mocker.patch.object(tasks, "_rabbit_channel", None)
+    return mocker.patch("octopoes.tasks.tasks.get_rabbit_channel", side_effect=lambda _: Mock(is_open=True))
+
+
+def test_channel_is_reused_between_tasks(rabbit_channel):
+    channel = tasks.get_channel()
+
+    assert tasks.get_channel() is channel
+    rabbit_channel.assert_called_once()
+
+
+def test_channel_reconnects_when_connection_is_lost(rabbit_channel):
+    channel = tasks.get_channel()
+    channel.connection.process_data_events.side_effect = StreamLostError()
+    channel.connection.close.side_effect = StreamLostError()
+
+    assert tasks.get_channel() is not channel
+    assert rabbit_channel.call_count == 2
+    channel.connection.close.assert_called_once()
+
+
+def test_channel_reconnects_when_closed(rabbit_channel):
+    channel = tasks.get_channel()
+    channel.is_open = False
+    channel.connection.is_open = True
+
+    assert tasks.get_channel() is not channel
+    assert rabbit_channel.call_count == 2
+    channel.connection.close.assert_called_once()
+
+
+def test_close_channel_on_worker_shutdown(rabbit_channel):
+    channel = tasks.get_channel()
+    channel.connection.is_open = True
+
+    tasks.close_channel()
+
+    channel.connection.close.assert_called_once()
+    assert tasks.get_channel() is not channel
+
+
+def test_bootstrap_does_not_return_a_shared_connection(rabbit_channel):
+    *_, rabbit_connection = bootstrap_octopoes(tasks.settings, "_dev", channel=tasks.get_channel())
+
+    assert rabbit_connection is None
@@ -3,8 +3,13 @@ from __future__ import annotations
 from unittest import TestCase
 from unittest.mock import patch
 
+from pydantic import ValidationError, parse_obj_as
+
 from octopoes.models import OOI
+from octopoes.models.ooi.network import IPAddressV4, IPAddressV6
 from octopoes.models.types import (
+    OOIType,
+    build_token_tree,
     get_concrete_types,
     get_abstract_types,
     to_concrete,
@@ -87,8 +92,41 @@ class TypeSystemTest(TestCase):
     def test_type_by_name(self):
         self.assertEqual(MockIPAddressV4, type_by_name("MockIPAddressV4"))
 
+    def test_type_by_name_unknown_type(self):
+        with self.assertRaises(KeyError):
+            type_by_name("IPAddressV4")
+
     def test_get_relations(self):
         self.assertEqual({"network": MockNetwork}, get_relations(MockIPAddressV4))
 
     def test_get_relations_abstract_class(self):
         self.assertEqual({"address": MockIPAddress}, get_relations(MockIPPort))
+
+    def test_build_token_tree(self):
+        self.assertEqual({"network": {"name": ""}, "address": ""}, build_token_tree(MockIPAddressV4))
+
+    def test_build_token_tree_cache_follows_all_types(self):
+        token_tree = build_token_tree(MockIPAddressV4)
+        self.assertIs(token_tree, build_token_tree(MockIPAddressV4))
+
+        with patch("octopoes.models.types.ALL_TYPES", set(ALL_OOI_TYPES)):
+            self.assertIsNot(token_tree, build_token_tree(MockIPAddressV4))
+
+
+class OOITypeTest(TestCase):
+    def test_parse_by_object_type(self):
+        ip_v4 = parse_obj_as(
+            OOIType, {"object_type": "IPAddressV4", "network": "Network|internet", "address": "1.1.1.1"}
+        )
+        ip_v6 = parse_obj_as(OOIType, {"object_type": "IPAddressV6", "network": "Network|internet", "address": "::1"})
+
+        self.assertIsInstance(ip_v4, IPAddressV4)
+        self.assertIsInstance(ip_v6, IPAddressV6)
+
+    def test_parse_missing_object_type(self):
+        with self.assertRaises(ValidationError):
+            parse_obj_as(OOIType, {"network": "Network|internet", "address": "1.1.1.1"})
+
+    def test_parse_unknown_object_type(self):
+        with self.assertRaises(ValidationError):
+            parse_obj_as(OOIType, {"object_type": "Unknown", "network": "Network|internet", "address": "1.1.1.1"})